@@ -1,6 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import argparse
+import hashlib
 import random
+import struct
+import sys
 import time
 from datetime import datetime
 
@@ -31,6 +35,7 @@ class MovieTicketBookingSystem:
                 "duration": "148 min",
                 "price": 4.00 * USD_TO_INR,
                 "showtimes": ["2:00 PM", "5:30 PM", "8:00 PM", "10:30 PM"],
+                "screens": {"2:00 PM": 2, "5:30 PM": 2, "8:00 PM": 1, "10:30 PM": 4},
                 "description": "A thief who steals corporate secrets through dream-sharing technology"
             },
             2: {
@@ -40,6 +45,7 @@ class MovieTicketBookingSystem:
                 "duration": "152 min",
                 "price": 3.00 * USD_TO_INR,
                 "showtimes": ["1:30 PM", "4:45 PM", "7:15 PM", "9:45 PM"],
+                "screens": {"1:30 PM": 1, "4:45 PM": 1, "7:15 PM": 4, "9:45 PM": 3},
                 "description": "Batman faces the Joker in this epic superhero thriller"
             },
             3: {
@@ -49,101 +55,391 @@ class MovieTicketBookingSystem:
                 "duration": "169 min",
                 "price": 5 * USD_TO_INR,
                 "showtimes": ["3:00 PM", "6:30 PM", "9:00 PM"],
+                "screens": {"3:00 PM": 3, "6:30 PM": 3, "9:00 PM": 2},
                 "description": "A team of explorers travel through a wormhole in space"
             }
         }
         
+        # Each screen in the multiplex has its own layout
         self.theaters = {
-            1: {
-                "seats": {},  # Will store seat data per movie/showtime
-                "seat_types": self.generate_seat_types(),
-                "total_seats": 48
-            }
+            1: self.create_theater("Screen 1", 6, 8),
+            2: self.create_theater("Screen 2", 8, 10),
+            3: self.create_theater("Gold Screen", 5, 6),
+            4: self.create_theater("Screen 4", 7, 9)
         }
         
         self.selected_movie = None
         self.selected_showtime = None
 
-    def generate_seat_types(self):
+    def create_theater(self, name, rows, cols):
+        return {
+            "name": name,
+            "rows": rows,
+            "cols": cols,
+            "seats": {},  # Will store seat data per movie/showtime
+            "seat_types": self.generate_seat_types(rows, cols),
+            "total_seats": rows * cols
+        }
+
+    def generate_seat_types(self, rows=6, cols=8):
         seat_types = {}
-        for row in range(6):
-            for col in range(8):
+        for row in range(rows):
+            for col in range(cols):
                 if row == 0:
                     seat_types[(row, col)] = {"type": "economy", "price_modifier": 0.8}
-                elif row >= 4:
+                elif row >= rows - 2:
                     seat_types[(row, col)] = {"type": "premium", "price_modifier": 1.3}
                 else:
                     seat_types[(row, col)] = {"type": "regular", "price_modifier": 1.0}
         return seat_types
 
-    def get_seat_price(self, movie_id, row, col):
+    def select_movie(self, movie_id):
+        self.selected_movie = movie_id
+        # Showtimes belong to a movie, so a new movie starts without one
+        self.selected_showtime = None
+
+    def select_showtime(self, showtime):
+        self.selected_showtime = showtime
+
+    def get_theater_id(self, movie_id, showtime):
         if movie_id not in self.movies:
-            return 0.0
-        base_price = self.movies[movie_id]["price"]
-        seat_type = self.theaters[1]["seat_types"][(row, col)]
-        return base_price * seat_type["price_modifier"]
+            return None
+        return self.movies[movie_id]["screens"].get(showtime)
 
-    def toggle_seat(self, theater_id, movie_id, showtime, row, col):
+    def get_current_theater_id(self):
+        if self.selected_movie:
+            theater_id = self.get_theater_id(self.selected_movie, self.selected_showtime)
+            if theater_id is None:
+                # No showtime picked yet: preview the first screen this movie plays on
+                movie = self.movies[self.selected_movie]
+                theater_id = movie["screens"][movie["showtimes"][0]]
+            return theater_id
+        # Nothing selected yet, so lay out the first screen
+        return next(iter(self.theaters))
+
+    def get_seat_map(self, theater_id, movie_id, showtime):
         key = f"{movie_id}_{showtime}"
+        theater = self.theaters[theater_id]
         
         # Initialize if this is the first interaction for this movie/showtime
-        if key not in self.theaters[theater_id]["seats"]:
-            self.theaters[theater_id]["seats"][key] = {
-                "matrix": [[0 for _ in range(8)] for _ in range(6)],
-                "booked_seats": set()
+        if key not in theater["seats"]:
+            theater["seats"][key] = {
+                "matrix": [[0 for _ in range(theater["cols"])] for _ in range(theater["rows"])],
+                "booked_seats": set(),
+                # Free-seat summary: longest run of unbooked adjacent seats per row
+                "free_runs": [theater["cols"]] * theater["rows"],
+                "free_count": theater["total_seats"]
             }
+        return theater["seats"][key]
+
+    def get_seat_price(self, theater_id, movie_id, row, col):
+        if movie_id not in self.movies:
+            return 0.0
+        base_price = self.movies[movie_id]["price"]
+        seat_type = self.theaters[theater_id]["seat_types"][(row, col)]
+        return base_price * seat_type["price_modifier"]
+
+    def toggle_seat(self, theater_id, movie_id, showtime, row, col):
+        seat_map = self.get_seat_map(theater_id, movie_id, showtime)
         
         # Don't toggle booked seats
-        if (row, col) in self.theaters[theater_id]["seats"][key]["booked_seats"]:
-            return self.theaters[theater_id]["seats"][key]["matrix"][row][col]
+        if (row, col) in seat_map["booked_seats"]:
+            return seat_map["matrix"][row][col]
         
         # Toggle seat selection
-        current_state = self.theaters[theater_id]["seats"][key]["matrix"][row][col]
-        self.theaters[theater_id]["seats"][key]["matrix"][row][col] = 1 - current_state
-        return self.theaters[theater_id]["seats"][key]["matrix"][row][col]
+        seat_map["matrix"][row][col] = 1 - seat_map["matrix"][row][col]
+        return seat_map["matrix"][row][col]
 
     def get_selected_seats(self, theater_id, movie_id, showtime):
         key = f"{movie_id}_{showtime}"
-        if key not in self.theaters[theater_id]["seats"]:
+        theater = self.theaters[theater_id]
+        if key not in theater["seats"]:
             return []
         
         selected = []
-        for row in range(6):
-            for col in range(8):
-                if self.theaters[theater_id]["seats"][key]["matrix"][row][col] == 1:
+        for row in range(theater["rows"]):
+            for col in range(theater["cols"]):
+                if theater["seats"][key]["matrix"][row][col] == 1:
                     selected.append((row, col))
         return selected
 
+    def clear_selection(self, theater_id, movie_id, showtime):
+        key = f"{movie_id}_{showtime}"
+        theater = self.theaters[theater_id]
+        if key not in theater["seats"]:
+            return
+        
+        for row in range(theater["rows"]):
+            for col in range(theater["cols"]):
+                if (row, col) not in theater["seats"][key]["booked_seats"]:
+                    theater["seats"][key]["matrix"][row][col] = 0
+
+    def random_selection(self, theater_id, movie_id, showtime, rng=random):
+        seat_map = self.get_seat_map(theater_id, movie_id, showtime)
+        theater = self.theaters[theater_id]
+        
+        available_seats = []
+        for row in range(theater["rows"]):
+            for col in range(theater["cols"]):
+                if (row, col) not in seat_map["booked_seats"] and \
+                   seat_map["matrix"][row][col] == 0:
+                    available_seats.append((row, col))
+        
+        if len(available_seats) < 2:
+            return []
+        
+        num_seats = min(rng.randint(2, 4), len(available_seats))
+        selected_seats = rng.sample(available_seats, num_seats)
+        
+        for row, col in selected_seats:
+            seat_map["matrix"][row][col] = 1
+        return selected_seats
+
     def calculate_total_price(self):
         if not self.selected_movie or not self.selected_showtime:
             return 0.0
         
         total = 0.0
-        selected_seats = self.get_selected_seats(1, self.selected_movie, self.selected_showtime)
+        theater_id = self.get_current_theater_id()
+        selected_seats = self.get_selected_seats(theater_id, self.selected_movie, self.selected_showtime)
         for row, col in selected_seats:
-            total += self.get_seat_price(self.selected_movie, row, col)
+            total += self.get_seat_price(theater_id, self.selected_movie, row, col)
         return total
 
     def book_seats(self, theater_id, movie_id, showtime, seats):
-        key = f"{movie_id}_{showtime}"
-        
-        # Initialize if this is the first booking for this movie/showtime
-        if key not in self.theaters[theater_id]["seats"]:
-            self.theaters[theater_id]["seats"][key] = {
-                "matrix": [[0 for _ in range(8)] for _ in range(6)],
-                "booked_seats": set()
-            }
+        seat_map = self.get_seat_map(theater_id, movie_id, showtime)
         
         # Mark seats as booked
         for row, col in seats:
-            self.theaters[theater_id]["seats"][key]["booked_seats"].add((row, col))
-            self.theaters[theater_id]["seats"][key]["matrix"][row][col] = 0
+            seat_map["booked_seats"].add((row, col))
+            seat_map["matrix"][row][col] = 0
+        
+        # Refresh the free-seat summary for the rows that changed
+        cols = self.theaters[theater_id]["cols"]
+        for row in {row for row, _ in seats}:
+            longest = run = 0
+            for col in range(cols):
+                if (row, col) in seat_map["booked_seats"]:
+                    run = 0
+                else:
+                    run += 1
+                    longest = max(longest, run)
+            seat_map["free_runs"][row] = longest
+        seat_map["free_count"] = self.theaters[theater_id]["total_seats"] - len(seat_map["booked_seats"])
+
+    def get_max_free_block(self, theater_id, movie_id, showtime):
+        key = f"{movie_id}_{showtime}"
+        theater = self.theaters[theater_id]
+        if key not in theater["seats"]:
+            return theater["cols"]
+        return max(theater["seats"][key]["free_runs"])
+
+    def find_showtimes_for_party(self, movie_id, party_size):
+        """Return (showtime, theater_id) pairs that can seat the party side by side"""
+        if movie_id not in self.movies or party_size < 1:
+            return []
+        
+        matches = []
+        for showtime in self.movies[movie_id]["showtimes"]:
+            theater_id = self.get_theater_id(movie_id, showtime)
+            if theater_id is None:
+                continue
+            
+            # The free count is a cheap check before looking at runs of seats
+            seat_map = self.theaters[theater_id]["seats"].get(f"{movie_id}_{showtime}")
+            if seat_map is not None and seat_map["free_count"] < party_size:
+                continue
+            if self.get_max_free_block(theater_id, movie_id, showtime) >= party_size:
+                matches.append((showtime, theater_id))
+        return matches
+
+# ======================== SESSION TRACE ========================
+TRACE_MAGIC = b"MTBS"
+TRACE_VERSION = 1
+
+OP_SELECT_MOVIE = 1
+OP_SELECT_SHOWTIME = 2
+OP_TOGGLE_SEAT = 3
+OP_BOOK_SEATS = 4
+OP_RANDOM_SELECTION = 5
+OP_CLEAR_SELECTION = 6
+OP_END = 255
+
+# Every event starts with its opcode and the microseconds since the previous event
+EVENT_HEADER = struct.Struct("<BI")
+DIGEST_SIZE = 32
+
+
+def state_digest(system):
+    """Fingerprint of every seat map, used to check a replay ends where the recording did"""
+    digest = hashlib.sha256()
+    for theater_id in sorted(system.theaters):
+        for key, seat_map in sorted(system.theaters[theater_id]["seats"].items()):
+            digest.update(f"{theater_id}|{key}|{sorted(seat_map['booked_seats'])}|{seat_map['matrix']}".encode())
+    return digest.digest()
+
+
+class SessionRecorder:
+    """Writes every core booking call made by the UI to a compact binary trace"""
+
+    def __init__(self, stream, clock=time.perf_counter):
+        self.stream = stream
+        self.clock = clock
+        self.last_time = clock()
+        self.stream.write(TRACE_MAGIC + bytes([TRACE_VERSION]))
+
+    def write_event(self, opcode, payload=b""):
+        now = self.clock()
+        delay = min(int((now - self.last_time) * 1_000_000), 0xFFFFFFFF)
+        self.last_time = now
+        self.stream.write(EVENT_HEADER.pack(opcode, delay) + payload)
+        # Flush each event so a crashed session still leaves a usable trace
+        self.stream.flush()
+
+    def select_movie(self, movie_id):
+        self.write_event(OP_SELECT_MOVIE, struct.pack("<H", movie_id))
+
+    def select_showtime(self, showtime):
+        encoded = showtime.encode()
+        self.write_event(OP_SELECT_SHOWTIME, struct.pack("<B", len(encoded)) + encoded)
+
+    def toggle_seat(self, theater_id, row, col):
+        self.write_event(OP_TOGGLE_SEAT, struct.pack("<HBB", theater_id, row, col))
+
+    def book_seats(self, theater_id, seats):
+        payload = struct.pack("<HB", theater_id, len(seats))
+        for row, col in seats:
+            payload += struct.pack("<BB", row, col)
+        self.write_event(OP_BOOK_SEATS, payload)
+
+    def random_selection(self, theater_id, seed):
+        self.write_event(OP_RANDOM_SELECTION, struct.pack("<HI", theater_id, seed))
+
+    def clear_selection(self, theater_id):
+        self.write_event(OP_CLEAR_SELECTION, struct.pack("<H", theater_id))
+
+    def close(self, system):
+        self.write_event(OP_END, state_digest(system))
+        self.stream.close()
+
+
+class SessionReplayer:
+    """Drives MovieTicketBookingSystem headlessly from a recorded trace"""
+
+    def __init__(self, events, expected_digest=None):
+        self.events = events
+        self.expected_digest = expected_digest
+
+    @classmethod
+    def load(cls, stream):
+        data = stream.read()
+        if len(data) <= len(TRACE_MAGIC) or data[:len(TRACE_MAGIC)] != TRACE_MAGIC:
+            raise ValueError("Not a booking session trace")
+        if data[len(TRACE_MAGIC)] != TRACE_VERSION:
+            raise ValueError(f"Unsupported trace version {data[len(TRACE_MAGIC)]}")
+        
+        events = []
+        expected_digest = None
+        offset = len(TRACE_MAGIC) + 1
+        while offset + EVENT_HEADER.size <= len(data):
+            opcode, delay = EVENT_HEADER.unpack_from(data, offset)
+            body = offset + EVENT_HEADER.size
+            
+            # Work out the payload size, reading a length field only if it was written
+            if opcode == OP_SELECT_MOVIE:
+                size = 2
+            elif opcode == OP_SELECT_SHOWTIME:
+                size = 1 + data[body] if body < len(data) else 1
+            elif opcode == OP_TOGGLE_SEAT:
+                size = 4
+            elif opcode == OP_BOOK_SEATS:
+                size = 3 + 2 * data[body + 2] if body + 3 <= len(data) else 3
+            elif opcode == OP_RANDOM_SELECTION:
+                size = 6
+            elif opcode == OP_CLEAR_SELECTION:
+                size = 2
+            elif opcode == OP_END:
+                size = DIGEST_SIZE
+            else:
+                raise ValueError(f"Unknown trace opcode {opcode}")
+            
+            if body + size > len(data):
+                # A session that crashed mid-write leaves a partial last event; drop it
+                break
+            
+            if opcode == OP_SELECT_MOVIE:
+                args = struct.unpack_from("<H", data, body)
+            elif opcode == OP_SELECT_SHOWTIME:
+                args = (data[body + 1:body + size].decode(),)
+            elif opcode == OP_TOGGLE_SEAT:
+                args = struct.unpack_from("<HBB", data, body)
+            elif opcode == OP_BOOK_SEATS:
+                theater_id = struct.unpack_from("<H", data, body)[0]
+                seats = [tuple(data[pos:pos + 2]) for pos in range(body + 3, body + size, 2)]
+                args = (theater_id, seats)
+            elif opcode == OP_RANDOM_SELECTION:
+                args = struct.unpack_from("<HI", data, body)
+            elif opcode == OP_CLEAR_SELECTION:
+                args = struct.unpack_from("<H", data, body)
+            else:
+                expected_digest = data[body:body + size]
+                break
+            
+            events.append((opcode, delay, args))
+            offset = body + size
+        
+        return cls(events, expected_digest)
+
+    def apply(self, system, opcode, args):
+        if opcode == OP_SELECT_MOVIE:
+            system.select_movie(*args)
+        elif opcode == OP_SELECT_SHOWTIME:
+            system.select_showtime(*args)
+        elif opcode == OP_TOGGLE_SEAT:
+            theater_id, row, col = args
+            system.toggle_seat(theater_id, system.selected_movie, system.selected_showtime, row, col)
+        elif opcode == OP_BOOK_SEATS:
+            theater_id, seats = args
+            system.book_seats(theater_id, system.selected_movie, system.selected_showtime, seats)
+        elif opcode == OP_RANDOM_SELECTION:
+            theater_id, seed = args
+            system.random_selection(theater_id, system.selected_movie, system.selected_showtime, random.Random(seed))
+        elif opcode == OP_CLEAR_SELECTION:
+            theater_id = args[0]
+            system.clear_selection(theater_id, system.selected_movie, system.selected_showtime)
+
+    def replay(self, system=None, paced=False):
+        if system is None:
+            system = MovieTicketBookingSystem()
+        
+        start = time.perf_counter()
+        target = start
+        for opcode, delay, args in self.events:
+            if paced:
+                # Schedule against the recorded timeline so sleeps don't accumulate drift
+                target += delay / 1_000_000
+                remaining = target - time.perf_counter()
+                if remaining > 0:
+                    time.sleep(remaining)
+            self.apply(system, opcode, args)
+        elapsed = time.perf_counter() - start
+        
+        digest = state_digest(system)
+        return {
+            "system": system,
+            "events": len(self.events),
+            "elapsed": elapsed,
+            "events_per_sec": len(self.events) / elapsed if elapsed else 0.0,
+            "digest": digest.hex(),
+            "matches": None if self.expected_digest is None else digest == self.expected_digest
+        }
 
 # ======================== UI ========================
 class MovieBookingApp:
-    def __init__(self, root):
+    def __init__(self, root, recorder=None):
         self.root = root
         self.system = MovieTicketBookingSystem()
+        self.recorder = recorder
         self.seat_buttons = []
         self.setup_ui()
         
@@ -226,6 +522,40 @@ class MovieBookingApp:
         
         self.showtime_buttons = []
         
+        # Group seating search across all screens
+        tk.Label(
+            self.movie_panel, 
+            text="👥 Seat Together", 
+            font=("Segoe UI", 12, "bold"), 
+            bg=PANEL_BG, 
+            fg=ACCENT
+        ).pack(pady=(20, 10))
+        
+        self.party_frame = tk.Frame(self.movie_panel, bg=PANEL_BG)
+        self.party_frame.pack(fill="x")
+        
+        self.party_size = tk.Spinbox(
+            self.party_frame,
+            from_=1,
+            to=10,
+            width=4,
+            font=("Segoe UI", 10),
+            bg=DARK_BG,
+            fg=TEXT_COLOR,
+            relief="flat"
+        )
+        self.party_size.pack(side="left", padx=(0, 5))
+        
+        tk.Button(
+            self.party_frame,
+            text="Find Showtimes",
+            font=("Segoe UI", 9),
+            bg=NEUTRAL,
+            fg=TEXT_COLOR,
+            relief="flat",
+            command=self.find_party_showtimes
+        ).pack(side="left", fill="x", expand=True)
+        
         # Center Panel - Seat Selection
         self.seat_panel = tk.Frame(self.main_frame, bg=PANEL_BG, padx=15, pady=15)
         self.seat_panel.pack(side="right", fill="both", expand=True)
@@ -272,37 +602,8 @@ class MovieBookingApp:
         self.seat_grid = tk.Frame(self.seat_panel, bg=PANEL_BG)
         self.seat_grid.pack(pady=10)
         
-        # Row labels
-        for row in range(6):
-            tk.Label(
-                self.seat_grid,
-                text=chr(65 + row),
-                font=("Segoe UI", 10, "bold"),
-                bg=PANEL_BG,
-                fg=TEXT_COLOR,
-                width=2
-            ).grid(row=row, column=0, padx=(0, 5))
-        
-        self.seat_buttons = []
-        for row in range(6):
-            row_buttons = []
-            for col in range(8):
-                btn = tk.Button(
-                    self.seat_grid,
-                    text=self.get_seat_symbol(row, col),
-                    font=("Segoe UI", 10),
-                    width=3,
-                    height=2,
-                    bg=DARK_BG,
-                    fg=self.get_seat_color(row, col),
-                    relief="flat",
-                    command=lambda r=row, c=col: self.select_seat(r, c)
-                )
-                btn.grid(row=row, column=col+1, padx=2, pady=2)
-                btn.bind("<Enter>", lambda e, r=row, c=col: self.on_seat_hover(r, c, True))
-                btn.bind("<Leave>", lambda e, r=row, c=col: self.on_seat_hover(r, c, False))
-                row_buttons.append(btn)
-            self.seat_buttons.append(row_buttons)
+        self.grid_theater_id = None
+        self.build_seat_grid()
         
         # Screen representation
         screen_frame = tk.Frame(self.seat_panel, bg=PANEL_BG)
@@ -398,21 +699,68 @@ class MovieBookingApp:
         
         self.update_display()
     
+    def current_theater(self):
+        return self.system.theaters[self.system.get_current_theater_id()]
+    
+    def build_seat_grid(self):
+        """Rebuild the seat buttons when switching to a screen with a different layout"""
+        theater_id = self.system.get_current_theater_id()
+        if theater_id == self.grid_theater_id:
+            return
+        self.grid_theater_id = theater_id
+        theater = self.system.theaters[theater_id]
+        
+        for widget in self.seat_grid.winfo_children():
+            widget.destroy()
+        
+        # Row labels
+        for row in range(theater["rows"]):
+            tk.Label(
+                self.seat_grid,
+                text=chr(65 + row),
+                font=("Segoe UI", 10, "bold"),
+                bg=PANEL_BG,
+                fg=TEXT_COLOR,
+                width=2
+            ).grid(row=row, column=0, padx=(0, 5))
+        
+        self.seat_buttons = []
+        for row in range(theater["rows"]):
+            row_buttons = []
+            for col in range(theater["cols"]):
+                btn = tk.Button(
+                    self.seat_grid,
+                    text=self.get_seat_symbol(row, col),
+                    font=("Segoe UI", 10),
+                    width=3,
+                    height=2,
+                    bg=DARK_BG,
+                    fg=self.get_seat_color(row, col),
+                    relief="flat",
+                    command=lambda r=row, c=col: self.select_seat(r, c)
+                )
+                btn.grid(row=row, column=col+1, padx=2, pady=2)
+                btn.bind("<Enter>", lambda e, r=row, c=col: self.on_seat_hover(r, c, True))
+                btn.bind("<Leave>", lambda e, r=row, c=col: self.on_seat_hover(r, c, False))
+                row_buttons.append(btn)
+            self.seat_buttons.append(row_buttons)
+    
     def update_clock(self):
         current_time = datetime.now().strftime("%H:%M:%S")
         self.clock_label.config(text=f"🕐 {current_time}")
         self.root.after(1000, self.update_clock)
     
     def get_seat_symbol(self, row, col):
-        seat_type = self.system.theaters[1]["seat_types"][(row, col)]
+        theater = self.current_theater()
+        seat_type = theater["seat_types"][(row, col)]
         
         # Check if we have a selected movie and showtime
         if self.system.selected_movie is not None and self.system.selected_showtime is not None:
             key = f"{self.system.selected_movie}_{self.system.selected_showtime}"
-            if key in self.system.theaters[1]["seats"]:
-                if (row, col) in self.system.theaters[1]["seats"][key]["booked_seats"]:
+            if key in theater["seats"]:
+                if (row, col) in theater["seats"][key]["booked_seats"]:
                     return "▦"  # Booked
-                elif self.system.theaters[1]["seats"][key]["matrix"][row][col] == 1:
+                elif theater["seats"][key]["matrix"][row][col] == 1:
                     return "■"  # Selected
         
         # Default symbols based on seat type
@@ -423,15 +771,16 @@ class MovieBookingApp:
         return "□"
     
     def get_seat_color(self, row, col):
-        seat_type = self.system.theaters[1]["seat_types"][(row, col)]
+        theater = self.current_theater()
+        seat_type = theater["seat_types"][(row, col)]
         
         # Check if we have a selected movie and showtime
         if self.system.selected_movie is not None and self.system.selected_showtime is not None:
             key = f"{self.system.selected_movie}_{self.system.selected_showtime}"
-            if key in self.system.theaters[1]["seats"]:
-                if (row, col) in self.system.theaters[1]["seats"][key]["booked_seats"]:
+            if key in theater["seats"]:
+                if (row, col) in theater["seats"][key]["booked_seats"]:
                     return BOOKED_COLOR
-                elif self.system.theaters[1]["seats"][key]["matrix"][row][col] == 1:
+                elif theater["seats"][key]["matrix"][row][col] == 1:
                     return HIGHLIGHT
         
         # Default colors based on seat type
@@ -442,7 +791,9 @@ class MovieBookingApp:
         return TEXT_COLOR
     
     def select_movie(self, movie_id):
-        self.system.selected_movie = movie_id
+        self.system.select_movie(movie_id)
+        if self.recorder:
+            self.recorder.select_movie(movie_id)
         
         # Update button states
         for mid, btn in self.movie_buttons.items():
@@ -452,6 +803,7 @@ class MovieBookingApp:
                 btn.config(bg=NEUTRAL, fg=TEXT_COLOR)
         
         self.update_showtimes()
+        self.build_seat_grid()
         self.refresh_seat_display()
     
     def update_showtimes(self):
@@ -478,7 +830,9 @@ class MovieBookingApp:
                 self.showtime_buttons.append(btn)
     
     def select_showtime(self, showtime):
-        self.system.selected_showtime = showtime
+        self.system.select_showtime(showtime)
+        if self.recorder:
+            self.recorder.select_showtime(showtime)
         
         # Update button states
         for btn in self.showtime_buttons:
@@ -487,12 +841,37 @@ class MovieBookingApp:
             else:
                 btn.config(bg=DARK_BG, fg=TEXT_COLOR)
         
+        self.build_seat_grid()
         self.refresh_seat_display()
     
+    def find_party_showtimes(self):
+        if not self.system.selected_movie:
+            messagebox.showwarning("No Movie Selected", "Please select a movie first!")
+            return
+        
+        try:
+            party_size = int(self.party_size.get())
+        except ValueError:
+            messagebox.showwarning("Invalid Party Size", "Please enter a number of guests!")
+            return
+        
+        movie_name = self.system.movies[self.system.selected_movie]["name"]
+        matches = self.system.find_showtimes_for_party(self.system.selected_movie, party_size)
+        if not matches:
+            messagebox.showinfo("No Showtimes", f"No showing of {movie_name} can seat {party_size} together.")
+            return
+        
+        lines = [f"{showtime} • {self.system.theaters[theater_id]['name']}" for showtime, theater_id in matches]
+        messagebox.showinfo(
+            "Showtimes Available",
+            f"{movie_name} can seat {party_size} together at:\n" + "\n".join(lines)
+        )
+    
     def refresh_seat_display(self):
         """Update all seat buttons to reflect current selection"""
-        for row in range(6):
-            for col in range(8):
+        theater = self.current_theater()
+        for row in range(theater["rows"]):
+            for col in range(theater["cols"]):
                 self.seat_buttons[row][col].config(
                     text=self.get_seat_symbol(row, col),
                     fg=self.get_seat_color(row, col),
@@ -505,11 +884,13 @@ class MovieBookingApp:
             # Only highlight if seat is available
             if self.system.selected_movie and self.system.selected_showtime:
                 key = f"{self.system.selected_movie}_{self.system.selected_showtime}"
-                if key in self.system.theaters[1]["seats"]:
-                    if (row, col) not in self.system.theaters[1]["seats"][key]["booked_seats"]:
+                theater = self.current_theater()
+                if key in theater["seats"]:
+                    if (row, col) not in theater["seats"][key]["booked_seats"]:
                         self.seat_buttons[row][col].config(bg=HOVER_COLOR)
-                        price = self.system.get_seat_price(self.system.selected_movie, row, col)
-                        seat_type = self.system.theaters[1]["seat_types"][(row, col)]["type"]
+                        theater_id = self.system.get_current_theater_id()
+                        price = self.system.get_seat_price(theater_id, self.system.selected_movie, row, col)
+                        seat_type = theater["seat_types"][(row, col)]["type"]
                         self.stats_label.config(text=f"Seat {chr(65+row)}{col+1} • {seat_type.title()} • ₹{price:.2f}")
         else:
             self.seat_buttons[row][col].config(bg=DARK_BG)
@@ -525,15 +906,19 @@ class MovieBookingApp:
             return
         
         key = f"{self.system.selected_movie}_{self.system.selected_showtime}"
+        theater_id = self.system.get_current_theater_id()
+        theater = self.system.theaters[theater_id]
         
         # Check if seat is already booked
-        if key in self.system.theaters[1]["seats"]:
-            if (row, col) in self.system.theaters[1]["seats"][key]["booked_seats"]:
+        if key in theater["seats"]:
+            if (row, col) in theater["seats"][key]["booked_seats"]:
                 messagebox.showinfo("Seat Booked", f"Seat {chr(65+row)}{col+1} is already booked!")
                 return
         
         # Toggle seat selection
-        self.system.toggle_seat(1, self.system.selected_movie, self.system.selected_showtime, row, col)
+        self.system.toggle_seat(theater_id, self.system.selected_movie, self.system.selected_showtime, row, col)
+        if self.recorder:
+            self.recorder.toggle_seat(theater_id, row, col)
         self.seat_buttons[row][col].config(
             text=self.get_seat_symbol(row, col),
             fg=self.get_seat_color(row, col)
@@ -543,14 +928,16 @@ class MovieBookingApp:
     def update_stats(self):
         selected_count = 0
         booked_count = 0
+        theater_id = self.system.get_current_theater_id()
+        theater = self.system.theaters[theater_id]
         
         if self.system.selected_movie and self.system.selected_showtime:
             key = f"{self.system.selected_movie}_{self.system.selected_showtime}"
-            if key in self.system.theaters[1]["seats"]:
-                selected_count = len(self.system.get_selected_seats(1, self.system.selected_movie, self.system.selected_showtime))
-                booked_count = len(self.system.theaters[1]["seats"][key]["booked_seats"])
+            if key in theater["seats"]:
+                selected_count = len(self.system.get_selected_seats(theater_id, self.system.selected_movie, self.system.selected_showtime))
+                booked_count = len(theater["seats"][key]["booked_seats"])
         
-        self.stats_label.config(text=f"Selected: {selected_count}/48 | Booked: {booked_count}")
+        self.stats_label.config(text=f"Selected: {selected_count}/{theater['total_seats']} | Booked: {booked_count}")
     
     def update_display(self):
         self.update_stats()
@@ -573,16 +960,18 @@ class MovieBookingApp:
             
             if self.system.selected_showtime:
                 self.details_text.insert(tk.END, f"🕐 Showtime: {self.system.selected_showtime}\n")
+                self.details_text.insert(tk.END, f"🏛️ Screen: {self.current_theater()['name']}\n")
             
             self.details_text.insert(tk.END, f"\n📋 Description:\n{movie['description']}\n\n")
         
         if self.system.selected_movie and self.system.selected_showtime:
-            selected_seats = self.system.get_selected_seats(1, self.system.selected_movie, self.system.selected_showtime)
+            theater_id = self.system.get_current_theater_id()
+            selected_seats = self.system.get_selected_seats(theater_id, self.system.selected_movie, self.system.selected_showtime)
             if selected_seats:
                 self.details_text.insert(tk.END, "🎭 Selected Seats:\n")
                 for row, col in selected_seats:
-                    seat_type = self.system.theaters[1]["seat_types"][(row, col)]
-                    price = self.system.get_seat_price(self.system.selected_movie, row, col)
+                    seat_type = self.system.theaters[theater_id]["seat_types"][(row, col)]
+                    price = self.system.get_seat_price(theater_id, self.system.selected_movie, row, col)
                     self.details_text.insert(tk.END, f"  Seat {chr(65+row)}{col+1} ({seat_type['type'].title()}) - ₹{price:.2f}\n")
             else:
                 self.details_text.insert(tk.END, "No seats selected\n")
@@ -590,11 +979,11 @@ class MovieBookingApp:
     def clear_selection(self):
         if self.system.selected_movie and self.system.selected_showtime:
             key = f"{self.system.selected_movie}_{self.system.selected_showtime}"
-            if key in self.system.theaters[1]["seats"]:
-                for row in range(6):
-                    for col in range(8):
-                        if (row, col) not in self.system.theaters[1]["seats"][key]["booked_seats"]:
-                            self.system.theaters[1]["seats"][key]["matrix"][row][col] = 0
+            theater_id = self.system.get_current_theater_id()
+            if key in self.system.theaters[theater_id]["seats"]:
+                self.system.clear_selection(theater_id, self.system.selected_movie, self.system.selected_showtime)
+                if self.recorder:
+                    self.recorder.clear_selection(theater_id)
                 self.refresh_seat_display()
     
     def random_selection(self):
@@ -603,30 +992,19 @@ class MovieBookingApp:
             messagebox.showwarning("Selection Needed", "Please select a movie and showtime first!")
             return
         
-        key = f"{self.system.selected_movie}_{self.system.selected_showtime}"
-        if key not in self.system.theaters[1]["seats"]:
-            self.system.theaters[1]["seats"][key] = {
-                "matrix": [[0 for _ in range(8)] for _ in range(6)],
-                "booked_seats": set()
-            }
-        
-        available_seats = []
-        for row in range(6):
-            for col in range(8):
-                if (row, col) not in self.system.theaters[1]["seats"][key]["booked_seats"] and \
-                   self.system.theaters[1]["seats"][key]["matrix"][row][col] == 0:
-                    available_seats.append((row, col))
+        # Seed a dedicated generator so a recorded session can be replayed exactly
+        theater_id = self.system.get_current_theater_id()
+        seed = random.getrandbits(32)
+        selected_seats = self.system.random_selection(
+            theater_id, self.system.selected_movie, self.system.selected_showtime, random.Random(seed)
+        )
+        if self.recorder:
+            self.recorder.random_selection(theater_id, seed)
         
-        if len(available_seats) < 2:
+        if not selected_seats:
             messagebox.showwarning("Not Enough Seats", "Not enough available seats for random selection!")
             return
         
-        num_seats = min(random.randint(2, 4), len(available_seats))
-        selected_seats = random.sample(available_seats, num_seats)
-        
-        for row, col in selected_seats:
-            self.system.theaters[1]["seats"][key]["matrix"][row][col] = 1
-        
         self.refresh_seat_display()
     
     def confirm_booking(self):
@@ -639,11 +1017,12 @@ class MovieBookingApp:
             return
         
         key = f"{self.system.selected_movie}_{self.system.selected_showtime}"
-        if key not in self.system.theaters[1]["seats"]:
+        theater_id = self.system.get_current_theater_id()
+        if key not in self.system.theaters[theater_id]["seats"]:
             messagebox.showwarning("No Seats", "Please select at least one seat!")
             return
         
-        selected_seats = self.system.get_selected_seats(1, self.system.selected_movie, self.system.selected_showtime)
+        selected_seats = self.system.get_selected_seats(theater_id, self.system.selected_movie, self.system.selected_showtime)
         if not selected_seats:
             messagebox.showwarning("No Seats", "Please select at least one seat!")
             return
@@ -657,12 +1036,15 @@ class MovieBookingApp:
             f"Confirm booking for {movie_name}?\n"
             f"Seats: {seat_list}\n"
             f"Total: ₹{total_price:.2f}\n"
-            f"Showtime: {self.system.selected_showtime}"
+            f"Showtime: {self.system.selected_showtime}\n"
+            f"Screen: {self.system.theaters[theater_id]['name']}"
         )
         
         if result:
             # Book the seats
-            self.system.book_seats(1, self.system.selected_movie, self.system.selected_showtime, selected_seats)
+            self.system.book_seats(theater_id, self.system.selected_movie, self.system.selected_showtime, selected_seats)
+            if self.recorder:
+                self.recorder.book_seats(theater_id, selected_seats)
             
             # Generate booking ID
             booking_id = f"BK{int(time.time()) % 1000000:06d}"
@@ -682,6 +1064,41 @@ class MovieBookingApp:
 
 # ======================== RUN APPLICATION ========================
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CineMatrix Pro movie ticket booking")
+    parser.add_argument("--record", metavar="TRACE", help="record the booking calls of this session to a trace file")
+    parser.add_argument("--replay", metavar="TRACE", help="replay a recorded trace headlessly and exit")
+    parser.add_argument("--paced", action="store_true", help="replay at the recorded pacing instead of full speed")
+    parser.add_argument("--repeat", type=int, default=1, help="number of replay runs, for benchmarking")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    
+    if args.replay:
+        with open(args.replay, "rb") as trace:
+            try:
+                replayer = SessionReplayer.load(trace)
+            except ValueError as error:
+                sys.exit(f"Cannot replay {args.replay}: {error}")
+        
+        diverged = False
+        for run in range(args.repeat):
+            result = replayer.replay(paced=args.paced)
+            if result["matches"] is None:
+                verdict = "no recorded final state"
+            elif result["matches"]:
+                verdict = "matches recording"
+            else:
+                verdict = "DIVERGED from recording"
+                diverged = True
+            print(
+                f"Run {run + 1}: {result['events']} events in {result['elapsed']:.4f}s "
+                f"({result['events_per_sec']:.0f} events/s) - {verdict}"
+            )
+        sys.exit(1 if diverged else 0)
+    
+    recorder = SessionRecorder(open(args.record, "wb")) if args.record else None
     root = tk.Tk()
-    app = MovieBookingApp(root)
-    root.mainloop()
\ No newline at end of file
+    app = MovieBookingApp(root, recorder)
+    root.mainloop()
+    if recorder:
+        recorder.close(app.system)
\ No newline at end of file
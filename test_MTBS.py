@@ -0,0 +1,106 @@
+import io
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from MTBS import MovieTicketBookingSystem, SessionRecorder, SessionReplayer
+
+
+class TestMultiplex(unittest.TestCase):
+    def setUp(self):
+        self.system = MovieTicketBookingSystem()
+
+    def test_no_overlapping_showings_on_a_screen(self):
+        showings = {}
+        for movie in self.system.movies.values():
+            duration = timedelta(minutes=int(movie["duration"].split()[0]))
+            for showtime in movie["showtimes"]:
+                start = datetime.strptime(showtime, "%I:%M %p")
+                showings.setdefault(movie["screens"][showtime], []).append((start, start + duration))
+        
+        for theater_id, runs in showings.items():
+            runs.sort()
+            for (_, end), (next_start, _) in zip(runs, runs[1:]):
+                self.assertLessEqual(end, next_start, f"Overlapping showings on screen {theater_id}")
+
+    def test_find_showtimes_for_party(self):
+        self.assertEqual(len(self.system.find_showtimes_for_party(1, 6)), 4)
+        
+        # Splitting every row of Screen 1 leaves no block of 5
+        self.system.book_seats(1, 1, "8:00 PM", [(row, 3) for row in range(6)])
+        self.assertNotIn(("8:00 PM", 1), self.system.find_showtimes_for_party(1, 5))
+        self.assertIn(("8:00 PM", 1), self.system.find_showtimes_for_party(1, 4))
+
+    def test_find_showtimes_skips_full_showings(self):
+        seats = [(row, col) for row in range(6) for col in range(8) if (row, col) != (0, 0)]
+        self.system.book_seats(1, 1, "8:00 PM", seats)
+        self.assertNotIn(("8:00 PM", 1), self.system.find_showtimes_for_party(1, 2))
+        self.assertIn(("8:00 PM", 1), self.system.find_showtimes_for_party(1, 1))
+
+    def test_current_theater_follows_selection(self):
+        self.assertEqual(self.system.get_current_theater_id(), 1)
+        self.system.select_movie(3)
+        self.assertEqual(self.system.get_current_theater_id(), 3)
+        self.system.select_showtime("9:00 PM")
+        self.assertEqual(self.system.get_current_theater_id(), 2)
+
+
+class InMemoryTrace(io.BytesIO):
+    """Keeps its contents readable after the recorder closes it"""
+
+    def close(self):
+        pass
+
+
+def record_session():
+    system = MovieTicketBookingSystem()
+    trace = InMemoryTrace()
+    recorder = SessionRecorder(trace)
+    
+    for movie_id, showtime, seed in [(1, "8:00 PM", 7), (2, "9:45 PM", 42), (1, "8:00 PM", 1234)]:
+        system.select_movie(movie_id)
+        recorder.select_movie(movie_id)
+        system.select_showtime(showtime)
+        recorder.select_showtime(showtime)
+        theater_id = system.get_current_theater_id()
+        
+        system.toggle_seat(theater_id, movie_id, showtime, 2, 3)
+        recorder.toggle_seat(theater_id, 2, 3)
+        system.random_selection(theater_id, movie_id, showtime, random.Random(seed))
+        recorder.random_selection(theater_id, seed)
+        seats = system.get_selected_seats(theater_id, movie_id, showtime)
+        system.book_seats(theater_id, movie_id, showtime, seats)
+        recorder.book_seats(theater_id, seats)
+        
+        system.random_selection(theater_id, movie_id, showtime, random.Random(seed + 1))
+        recorder.random_selection(theater_id, seed + 1)
+        system.clear_selection(theater_id, movie_id, showtime)
+        recorder.clear_selection(theater_id)
+    
+    recorder.close(system)
+    return trace.getvalue()
+
+
+class TestSessionTrace(unittest.TestCase):
+    def test_replay_matches_recording(self):
+        result = SessionReplayer.load(io.BytesIO(record_session())).replay()
+        self.assertEqual(result["events"], 21)
+        self.assertIs(result["matches"], True)
+
+    def test_truncated_trace_replays(self):
+        data = record_session()
+        for cut in range(5, len(data)):
+            with self.subTest(cut=cut):
+                result = SessionReplayer.load(io.BytesIO(data[:cut])).replay()
+                # Without the complete final digest there is nothing to compare against
+                self.assertIsNone(result["matches"])
+
+    def test_rejects_non_trace(self):
+        for data in [b"", b"MTBS", b"NOPE\x01"]:
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    SessionReplayer.load(io.BytesIO(data))
+
+
+if __name__ == "__main__":
+    unittest.main()